@@ -1,13 +1,193 @@
+import csv
+import functools
+import os
+from array import array
+from itertools import islice, repeat
+from types import MappingProxyType
+
+
+def _coerce(values):
+    """Store a homogeneous int or float column as a typed array"""
+    if isinstance(values, array) and values.typecode in ('q', 'd'):
+        # Already packed, e.g. by from_csv()
+        return values, int if values.typecode == 'q' else float
+    types = set(map(type, values))
+    if types == {int}:
+        try:
+            return array('q', values), int
+        except OverflowError:
+            # Too large for 64 bits -- keep the Python ints
+            return values, int
+    elif types == {float}:
+        return array('d', values), float
+    return values, object
+
+
+def _convert(values, dtype):
+    """Convert CSV fields to `dtype`, raising ValueError if some don't fit"""
+    # Fill typed arrays straight from map() so no intermediate
+    # list of boxed numbers is built
+    if dtype is int:
+        try:
+            return array('q', map(int, values))
+        except OverflowError:
+            # Too large for 64 bits -- keep the Python ints
+            return list(map(int, values))
+    if dtype is float:
+        return array('d', map(float, values))
+    return list(values)
+
+
+def _to_numbers(values):
+    """Convert a column of CSV fields to ints or floats if possible"""
+    if values:
+        for dtype in (int, float):
+            try:
+                return _convert(values, dtype), dtype
+            except ValueError:
+                pass
+    # Not numeric, or no data to infer a type from -- keep the strings
+    return list(values), object
+
+
+def _extend_column(column, dtype, values):
+    """Append a chunk of CSV fields to a converted column
+
+    An int column is widened to float if the new fields need it. Returns
+    the column and its dtype, or raises ValueError if the fields don't fit.
+    """
+    try:
+        new = _convert(values, dtype)
+    except ValueError:
+        if dtype is not int:
+            raise
+        new = _convert(values, float)
+        column, dtype = array('d', map(float, column)), float
+    if isinstance(column, array) and not isinstance(new, array):
+        # Big ints joining a 64-bit array
+        column = column.tolist()
+    column.extend(new)
+    return column, dtype
+
+
+def _read_header(reader, filename):
+    """Read the header row of a CSV file"""
+    try:
+        return next(reader)
+    except StopIteration:
+        raise ValueError(f"'{filename}' is empty -- expected a header row") from None
+
+
+def _rows_to_fields(header, rows, filename):
+    """Transpose split CSV rows into a dict of columns of raw fields"""
+    if len(header) == 1:
+        # csv.reader yields [] for a blank line, which is an empty
+        # field when there's only one column
+        rows = [row or [''] for row in rows]
+    if rows and min(map(len, rows)) < len(header):
+        raise ValueError(f"'{filename}' has rows with fewer fields than the header")
+
+    # Transpose in C
+    return dict(zip(header, zip(*rows)))
+
+
+def _read_csv_columns(filename, chunk_rows=10_000):
+    """Read a CSV file into a dict of converted columns, chunk by chunk"""
+    # Columns that turn out to hold text only after earlier chunks were
+    # converted to numbers. The raw fields are gone by then, so the file
+    # is read again with these columns kept as strings
+    text_columns = set()
+    while True:
+        with open(filename, 'r', newline='', buffering=1 << 20) as f:
+            reader = csv.reader(f)
+            header = _read_header(reader, filename)
+            columns = {}
+            dtypes = {}
+            found_text = False
+
+            # Convert each chunk right away, so the raw rows of the
+            # whole file are never in memory at once
+            for rows in iter(lambda: list(islice(reader, chunk_rows)), []):
+                fields = _rows_to_fields(header, rows, filename)
+                for col, values in fields.items():
+                    if col in text_columns:
+                        columns.setdefault(col, []).extend(values)
+                        dtypes[col] = object
+                    elif col not in columns:
+                        columns[col], dtypes[col] = _to_numbers(values)
+                    else:
+                        try:
+                            columns[col], dtypes[col] = _extend_column(
+                                columns[col], dtypes[col], values
+                            )
+                        except ValueError:
+                            text_columns.add(col)
+                            found_text = True
+                if found_text:
+                    break
+
+        if not found_text:
+            break
+
+    return {col: columns.get(col, []) for col in header}
+
+
+def _convert_to_schema(fields, dtypes, filename):
+    """Convert a chunk of CSV fields to the column types of an earlier chunk"""
+    columns = {}
+    for col, values in fields.items():
+        try:
+            columns[col] = _convert(values, dtypes[col])
+        except ValueError:
+            raise ValueError(
+                f"column '{col}' of '{filename}' was read as "
+                f"{dtypes[col].__name__} from the first chunk, but a later "
+                f"chunk doesn't fit -- use from_csv() or a larger chunk_size"
+            ) from None
+    return columns
+
+
+def _needs_quoting(values):
+    """Check if csv.writer might quote or convert a value in a column"""
+    if set(map(type, values)) != {str} or "" in values:
+        # Leave None, bools, empty fields, etc. to csv.writer
+        return True
+    text = "".join(values)
+    return any(char in text for char in ',"\r\n')
+
+
+@functools.lru_cache(maxsize=32)
+def _read_csv_cached(cls, path, mtime_ns, size):
+    """Parse a CSV file once per path, modification time, and size"""
+    return cls.from_csv(path)
+
+
+def set_csv_cache_size(maxsize):
+    """Set how many parsed CSV files `from_csv(..., cache=True)` keeps"""
+    global _read_csv_cached
+    _read_csv_cached = functools.lru_cache(maxsize=maxsize)(
+        _read_csv_cached.__wrapped__
+    )
+
+
+def clear_csv_cache():
+    """Forget all CSV files parsed with `from_csv(..., cache=True)`"""
+    _read_csv_cached.cache_clear()
+
+
 class MinDF:
     def __init__(self, **kwargs):
         # Verify all items have the same length
         if not kwargs:
-            self.data = {}
+            self.data = MappingProxyType({})
+            self._dtypes = {}
+            self._keys = ()
+            self._values = ()
             self._length = 0
             return
 
         # Get the length of the first item (and its key)
-        first_key = next(iter(kwargs.keys()))
+        first_key = next(iter(kwargs))
         expected_length = len(kwargs[first_key])
 
         # Check all other items -- the length must be
@@ -19,10 +199,19 @@ class MinDF:
                     f"but '{key}' has length {len(item)}"
                 )
 
-        lengths = {len(v) for v in kwargs.values()}
+        # Pack numeric columns into contiguous typed buffers
+        data = {}
+        self._dtypes = {}
+        for key, item in kwargs.items():
+            data[key], self._dtypes[key] = _coerce(item)
+
+        # Columns can't be added or replaced later, so the snapshots
+        # of names and columns for hot loops can't go stale
+        self.data = MappingProxyType(data)
+        self._keys = tuple(data)
+        self._values = tuple(self.data.values())
 
-        self.data = kwargs
-        self._length = lengths.pop() if lengths else 0
+        self._length = expected_length
     
     def __len__(self):
         """Disallow len() for MinDF"""
@@ -47,96 +236,98 @@ class MinDF:
     
     def col(self, colname):
         """Get a column by name"""
-        if colname not in self.data.keys():
-            raise ValueError(f"'{colname}' is not a column name")
-        return self.data.get(colname)
-    
+        try:
+            return self.data[colname]
+        except KeyError:
+            raise ValueError(f"'{colname}' is not a column name") from None
+
+    def buffer(self, colname):
+        """Get a numeric column as a zero-copy memoryview"""
+        values = self.col(colname)
+        if not isinstance(values, array):
+            raise TypeError(f"'{colname}' is not a numeric column")
+        return memoryview(values)
+
     def row(self, index):
         """Get a row (dict) by index"""
-        if abs(index) >= self._length:
-            raise ValueError(f"index {index} is out of range; number of rows is {self._length}")
+        # Valid indices run from -n to n - 1, as with lists
+        n = self._length
+        if not -n <= index < n:
+            raise ValueError(f"index {index} is out of range; number of rows is {n}")
         return {col: values[index] for col, values in self.data.items()}
     
     def __getitem__(self, key):
         """Get a column by name or a row by index"""
         if isinstance(key, str):
-            return self.data[key]
+            return self.col(key)
         elif isinstance(key, int):
             return self.row(key)
-            # return {col: values[key] for col, values in self.data.items()}
         raise TypeError(f"Invalid key type: {type(key)}")
-    
+
+    def __iter__(self):
+        """Iterate over rows (dicts)"""
+        keys = self._keys
+        return (dict(zip(keys, values)) for values in zip(*self._values))
+
     # Start of internal helpers for __str__():
     def _get_column_widths(self):
         """Calculate the maximum width needed for each column"""
         widths = {}
         for col, values in self.data.items():
-            # Width of column name
-            max_width = len(str(col))
-            # Width of longest value
-            for val in values:
-                max_width = max(max_width, len(str(val)))
-            widths[col] = max_width
+            if self._dtypes[col] is int and values:
+                # The longest int is either the smallest or the largest,
+                # so there's no need to format every value
+                value_width = max(len(str(min(values))), len(str(max(values))))
+            else:
+                # Width of longest value, scanned inside map() and max()
+                value_width = max(map(len, map(str, values)), default=0)
+            # Compare with width of column name
+            widths[col] = max(len(str(col)), value_width)
         return widths
     
-    def _format_row(self, values, widths):
-        """Format a single row of data with proper padding"""
-        return "│ " + " │ ".join(
-            str(val).ljust(widths[col]) 
-            for col, val in zip(self.data.keys(), values)
-        ) + " │"
-    
     def _format_header(self, widths):
         """Format the header row with column names"""
         return "│ " + " │ ".join(
             col.ljust(widths[col]) 
-            for col in self.data.keys()
+            for col in self._keys
         ) + " │"
     
-    def _format_separator(self, widths, char="─"):
-        """Create a separator line"""
-        parts = []
-        for col in self.data.keys():
-            parts.append(char * widths[col])
-        return f"├─{'─┼─'.join(parts)}─┤"
-    
-    def _format_top_border(self, widths):
-        """Create the top border"""
-        parts = []
-        for col in self.data.keys():
-            parts.append("─" * widths[col])
-        return f"┌─{'─┬─'.join(parts)}─┐"
-    
-    def _format_bottom_border(self, widths):
-        """Create the bottom border"""
-        parts = []
-        for col in self.data.keys():
-            parts.append("─" * widths[col])
-        return f"└─{'─┴─'.join(parts)}─┘"
+    def _format_borders(self, widths):
+        """Create the top border, separator, and bottom border"""
+        parts = ["─" * widths[col] for col in self._keys]
+        return (
+            f"┌─{'─┬─'.join(parts)}─┐",
+            f"├─{'─┼─'.join(parts)}─┤",
+            f"└─{'─┴─'.join(parts)}─┘",
+        )
 
     def __str__(self):
         """Tabular string display"""
         if not self.data:
             return "Empty MinDF"
         
-        # Get maximum width for each column
+        # Get maximum width for each column, and the borders sized to fit
         widths = self._get_column_widths()
+        top, separator, bottom = self._format_borders(widths)
         
         # Build the string representation
         lines = []
         
         # Add top border, header, and separator
-        lines.append(self._format_top_border(widths))
+        lines.append(top)
         lines.append(self._format_header(widths))
-        lines.append(self._format_separator(widths))
+        lines.append(separator)
         
-        # Add data rows
-        for i in range(self.count_rows()):
-            values = [self.data[col][i] for col in self.data.keys()]
-            lines.append(self._format_row(values, widths))
+        # Add data rows: pad each column in one pass, then join
+        # the padded cells row by row
+        padded = [
+            list(map(str.ljust, map(str, column), repeat(widths[col])))
+            for col, column in zip(self._keys, self._values)
+        ]
+        lines.extend("│ " + " │ ".join(cells) + " │" for cells in zip(*padded))
         
         # Add bottom border
-        lines.append(self._format_bottom_border(widths))
+        lines.append(bottom)
         
         return "\n".join(lines)
     
@@ -148,6 +339,8 @@ class MinDF:
         # Format each column's data
         parts = []
         for col, values in self.data.items():
+            if isinstance(values, array):
+                values = values.tolist()
             parts.append(f"{col}={repr(values)}")
         
         return f"MinDF({', '.join(parts)})"
@@ -157,40 +350,83 @@ class MinDF:
         if not self.data:
             return
         
-        with open(filename, 'w') as f:
+        # A large write buffer means few syscalls
+        with open(filename, 'w', newline='', buffering=1 << 20) as f:
+            writer = csv.writer(f, lineterminator='\n')
             # Write header
-            f.write(','.join(self.data.keys()) + '\n')
-            
-            # Write rows
-            for i in range(self.count_rows()):
-                row = [str(self.data[col][i]) for col in self.data.keys()]
-                f.write(','.join(row) + '\n')
+            writer.writerow(self._keys)
+            # Write rows. Numbers never need quoting, and neither do most
+            # strings, so such frames can skip the csv module's per-field checks
+            object_columns = [
+                values for values, dtype in zip(self._values, self._dtypes.values())
+                if dtype is object
+            ]
+            if not any(map(_needs_quoting, object_columns)):
+                # One "%s,%s,...\n" format for all rows, applied in C
+                row_format = ",".join(["%s"] * len(self._values)) + "\n"
+                f.writelines(map(row_format.__mod__, zip(*self._values)))
+            else:
+                writer.writerows(zip(*self._values))
 
         
     @classmethod
-    def from_csv(cls, filename):
-        """Read a CSV file into a MinDF"""
-        with open(filename, 'r') as f:
+    def from_csv(cls, filename, cache=False):
+        """Read a CSV file into a MinDF
+
+        With `cache=True`, an earlier parse is reused if the file hasn't
+        changed since. Each call still gets its own copy of the columns,
+        so modifying one MinDF doesn't affect any other.
+        """
+        if cache:
+            st = os.stat(filename)
+            cached = _read_csv_cached(
+                cls, os.path.abspath(filename), st.st_mtime_ns, st.st_size
+            )
+            # Copying an array is a memcpy, far cheaper than parsing
+            return cls(**{col: values[:] for col, values in cached.data.items()})
+
+        return cls(**_read_csv_columns(filename))
+
+    @classmethod
+    def from_csv_chunks(cls, filename, chunk_size=100_000):
+        """Read a CSV file into MinDFs of at most `chunk_size` rows each
+
+        Column types are inferred from the first chunk and kept for all
+        later ones, so every chunk has the same types as `from_csv()` would
+        give. If a later chunk doesn't fit them (e.g., text in a column that
+        started out numeric), a ValueError is raised.
+        """
+        # Check here rather than in the generator, so that a bad
+        # `chunk_size` fails when it's passed, not on first iteration
+        if isinstance(chunk_size, bool) or not isinstance(chunk_size, int):
+            raise TypeError(f"chunk_size must be an int, not {type(chunk_size)}")
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be at least 1, not {chunk_size}")
+        return cls._iter_csv_chunks(filename, chunk_size)
+
+    @classmethod
+    def _iter_csv_chunks(cls, filename, chunk_size):
+        """Generator behind from_csv_chunks()"""
+        with open(filename, 'r', newline='', buffering=1 << 20) as f:
+            reader = csv.reader(f)
             # Read header
-            header = next(f).strip().split(',')
-            
-            # Initialize columns
-            columns = {col: [] for col in header}
-            
-            # Read data
-            for line in f:
-                values = line.strip().split(',')
-                for col, val in zip(header, values):
-                    # Try to convert to numeric if possible
-                    try:
-                        val = float(val)
-                        if val.is_integer():
-                            val = int(val)
-                    except ValueError:
-                        pass
-                    columns[col].append(val)
-        
-        return cls(**columns)
+            header = _read_header(reader, filename)
+
+            # Parse and yield one chunk at a time
+            dtypes = None
+            while True:
+                rows = list(islice(reader, chunk_size))
+                if not rows:
+                    return
+                fields = _rows_to_fields(header, rows, filename)
+                if dtypes is None:
+                    # The first chunk fixes the column types
+                    columns, dtypes = {}, {}
+                    for col, values in fields.items():
+                        columns[col], dtypes[col] = _to_numbers(values)
+                else:
+                    columns = _convert_to_schema(fields, dtypes, filename)
+                yield cls(**columns)
 
 # Example usage:
 if __name__ == "__main__":